@@ -151,6 +151,9 @@ CREATE TABLE IF NOT EXISTS embeddings (
     content text NOT NULL,
     content_hash varchar(64),
     embedding vector(1536) NOT NULL,
+    -- fp16 shadow of embedding (pgvector >= 0.7): half the scan bandwidth for
+    -- ANN search; the fp32 column is retained for exact reranking.
+    embedding_half halfvec(1536) GENERATED ALWAYS AS ((embedding)::halfvec(1536)) STORED,
     company_name varchar(255) NOT NULL,
     file_name varchar(500) NOT NULL,
     file_type varchar(100) NOT NULL,
@@ -171,7 +174,10 @@ CREATE TABLE IF NOT EXISTS embeddings (
 
 CREATE INDEX IF NOT EXISTS idx_embeddings_deal ON embeddings(deal_id);
 CREATE INDEX IF NOT EXISTS idx_embeddings_document ON embeddings(document_id);
-CREATE INDEX IF NOT EXISTS idx_embeddings_vector ON embeddings USING hnsw (embedding vector_cosine_ops);
+CREATE INDEX IF NOT EXISTS idx_embeddings_vector_half ON embeddings USING hnsw (embedding_half halfvec_cosine_ops);
+-- Non-unique: the same chunk text legitimately appears once per document;
+-- the index only serves the reuse lookup during ingestion.
+CREATE INDEX IF NOT EXISTS idx_embeddings_content_hash ON embeddings(content_hash) WHERE content_hash IS NOT NULL;
 
 CREATE TRIGGER tg_embeddings_updated_at
     BEFORE UPDATE ON embeddings
@@ -195,10 +201,12 @@ CREATE TABLE IF NOT EXISTS runs (
     params jsonb NOT NULL DEFAULT '{}'::jsonb,
     included_file_ids text[] NOT NULL DEFAULT ARRAY[]::text[],
     parent_run_id uuid REFERENCES runs(id),
-    extracted_variables_artifact_id uuid
+    extracted_variables_artifact_id uuid,
+    rendered_artifact_id uuid
 );
 
 CREATE INDEX IF NOT EXISTS idx_runs_deal ON runs(deal_id);
+CREATE INDEX IF NOT EXISTS idx_runs_deal_created ON runs(deal_id, created_at);
 
 CREATE TABLE IF NOT EXISTS run_steps (
     id uuid PRIMARY KEY DEFAULT uuid_generate_v4(),
@@ -219,6 +227,8 @@ CREATE TABLE IF NOT EXISTS artifacts (
     created_at timestamptz NOT NULL DEFAULT now()
 );
 
+CREATE INDEX IF NOT EXISTS idx_artifacts_run_kind_created ON artifacts(run_id, kind, created_at);
+
 --
 -- Listings / access requests
 --
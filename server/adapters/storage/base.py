@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 
 @dataclass
@@ -33,6 +33,10 @@ class StorageBackend:
     def download_to_path(self, key: str, destination: Path) -> None:
         raise NotImplementedError
 
+    def open(self, key: str) -> Iterator[bytes]:
+        """Yield the object's bytes in chunks without touching the filesystem."""
+        raise NotImplementedError
+
     def delete(self, key: str) -> None:
         raise NotImplementedError
 
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import shutil
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from .base import StorageBackend, StorageObject
 
@@ -42,6 +42,14 @@ class LocalStorageBackend(StorageBackend):
         destination.parent.mkdir(parents=True, exist_ok=True)
         shutil.copy2(source, destination)
 
+    def open(self, key: str) -> Iterator[bytes]:
+        source = self._base_dir / key
+        if not source.exists():
+            raise FileNotFoundError(source)
+        with source.open("rb") as f:
+            while chunk := f.read(64 * 1024):
+                yield chunk
+
     def delete(self, key: str) -> None:
         target = self._base_dir / key
         if target.exists():
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 import httpx
 
@@ -62,6 +62,15 @@ class SupabaseStorageBackend(StorageBackend):
         destination.parent.mkdir(parents=True, exist_ok=True)
         destination.write_bytes(response.content)
 
+    def open(self, key: str) -> Iterator[bytes]:
+        with self._client.stream("GET", f"/object/{self._config.bucket}/{key}") as response:
+            if response.status_code >= 400:
+                response.read()
+                raise StorageError(
+                    f"Failed to stream '{key}': {response.status_code} {response.text}"
+                )
+            yield from response.iter_bytes()
+
     def delete(self, key: str) -> None:
         payload = {"paths": [key]}
         response = self._client.post(f"/object/delete/{self._config.bucket}", json=payload)
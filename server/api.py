@@ -6,13 +6,14 @@ from typing import Dict
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from server.core.config import (
     CORS_ALLOW_CREDENTIALS,
     CORS_ALLOW_ORIGINS,
     EMBEDDING_MODEL,
     VECTOR_STORE_DSN,
 )
-from server.core.embeddings import EMBED_DIMENSIONS
+from server.core.embeddings import EMBED_DIMENSIONS, ProfileEmbedder
 from server.routes import (
     artifacts_router,
     auth_router,
@@ -38,6 +39,7 @@ def create_app() -> FastAPI:
         title="Scope Doc Generator API",
         version="0.1.0",
         description="Backend services for the scope document generator platform.",
+        default_response_class=ORJSONResponse,
     )
 
     # CORS configuration (placeholder defaults; tighten once frontend origin is known)
@@ -60,8 +62,11 @@ def create_app() -> FastAPI:
     app.state.vector_store = vector_store
     app.state.job_registry = job_registry
     app.state.document_ingestion = ingestion_service
+    # Shared across requests; the OpenAI client inside is thread-safe.
+    app.state.profile_embedder = ProfileEmbedder()
 
     app.add_event_handler("shutdown", ingestion_service.shutdown)
+    app.add_event_handler("shutdown", vector_store.close)
 
     app.include_router(system_router)
     app.include_router(auth_router)
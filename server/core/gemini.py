@@ -108,8 +108,33 @@ class GeminiClient:
 
         return response.text.strip()
 
-    def describe_visual(self, image: Image.Image, *, prompt: Optional[str] = None) -> str:
-        """Describe a PIL image object (useful for PDF page renders)."""
+    def describe_visual(
+        self,
+        image_bytes: bytes,
+        *,
+        mime_type: str = "image/jpeg",
+        prompt: Optional[str] = None,
+    ) -> str:
+        """Describe raw encoded image bytes (useful for PDF page renders)."""
+
+        user_prompt = prompt or (
+            "Extract every legible piece of text, label, or data visible in this asset. "
+            "Return a concise summary and include bullet points for any numbers, metrics, or captions."
+        )
+
+        try:
+            response = self._model.generate_content(
+                [user_prompt, {"mime_type": mime_type, "data": image_bytes}],
+                generation_config=genai.GenerationConfig(
+                    temperature=self.temperature,
+                    max_output_tokens=min(1024, self.max_output_tokens),
+                ),
+            )
+        except GoogleAPIError as exc:
+            raise GeminiError(f"Gemini vision error: {exc}") from exc
 
-        return self._describe_pil_image(image, prompt=prompt)
+        if not response or not response.text:
+            raise GeminiError("Gemini returned an empty response for the visual prompt")
+
+        return response.text.strip()
 
@@ -11,6 +11,7 @@ from sqlalchemy import (
     Boolean,
     Date,
     DateTime,
+    Index,
     Integer,
     Numeric,
     String,
@@ -334,6 +335,11 @@ class TeamMember(Base):
 
 class Run(Base):
     __tablename__ = "runs"
+    __table_args__ = (
+        # Run lists are always per deal, newest first; Postgres walks the
+        # btree backwards for the DESC ordering.
+        Index("idx_runs_deal_created", "deal_id", "created_at"),
+    )
 
     id: Mapped[UUID_t] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     deal_id: Mapped[UUID_t] = mapped_column(UUID(as_uuid=True), ForeignKey("deals.id", ondelete="CASCADE"), nullable=False)
@@ -345,11 +351,16 @@ class Run(Base):
     finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     result_path: Mapped[str | None] = mapped_column(Text, nullable=True)
     error: Mapped[str | None] = mapped_column(Text, nullable=True)
-    instructions: Mapped[str | None] = mapped_column(Text, nullable=True)
-    params: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)
+    # Deferred: only the single-run getters need these payloads; list
+    # endpoints skip the per-row JSON decode entirely.
+    instructions: Mapped[str | None] = mapped_column(Text, nullable=True, deferred=True)
+    params: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict, deferred=True)
     included_file_ids: Mapped[list[str]] = mapped_column(ARRAY(String), nullable=False, default=list)
     parent_run_id: Mapped[UUID_t | None] = mapped_column(UUID(as_uuid=True), ForeignKey("runs.id"), nullable=True)
     extracted_variables_artifact_id: Mapped[UUID_t | None] = mapped_column(UUID(as_uuid=True), nullable=True)
+    # Denormalized pointer to the run's rendered_doc artifact, written by the
+    # worker so list endpoints avoid a per-kind artifacts lookup.
+    rendered_artifact_id: Mapped[UUID_t | None] = mapped_column(UUID(as_uuid=True), nullable=True)
 
     deal: Mapped[Deal] = relationship("Deal", back_populates="runs")
     parent_run: Mapped[Optional["Run"]] = relationship("Run", remote_side=[id], uselist=False)
@@ -373,6 +384,10 @@ class RunStep(Base):
 
 class Artifact(Base):
     __tablename__ = "artifacts"
+    __table_args__ = (
+        # Serves the latest-per-(run, kind) DISTINCT ON lookups
+        Index("idx_artifacts_run_kind_created", "run_id", "kind", "created_at"),
+    )
 
     id: Mapped[UUID_t] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     run_id: Mapped[UUID_t] = mapped_column(UUID(as_uuid=True), ForeignKey("runs.id", ondelete="CASCADE"), nullable=False)
@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, EmailStr, Field, PrivateAttr
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from server.core.config import (
@@ -33,6 +33,9 @@ class SessionUser(BaseModel):
     full_name: Optional[str] = None
     role: str
 
+    # Request-scoped memo for rbac team lookups; never serialized.
+    _team_ids: Optional[list] = PrivateAttr(default=None)
+
     class Config:
         from_attributes = True
 
@@ -155,7 +158,7 @@ def login(
     if not user.is_active:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="User is disabled")
 
-    user.last_login_at = datetime.utcnow()
+    user.last_login_at = func.now()
     db.add(user)
     db.commit()
     db.refresh(user)
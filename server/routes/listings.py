@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, Field, ConfigDict
+from sqlalchemy import func
 from sqlalchemy.orm import Session, joinedload
 
 from ..dependencies import db_session
@@ -289,7 +289,7 @@ async def update_access_request(
     if payload.status is not None:
         record.status = payload.status
         record.reviewed_by = current_user.id
-        record.reviewed_at = datetime.utcnow()
+        record.reviewed_at = func.now()
     if payload.notes is not None:
         record.notes = payload.notes
 
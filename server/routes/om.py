@@ -3,21 +3,25 @@
 from __future__ import annotations
 
 import json
-from datetime import datetime
+import logging
+import shutil
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
 from fastapi import status
-from jinja2 import Template
+from fastapi.concurrency import run_in_threadpool
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 from openai import OpenAI
 import fitz
-from PIL import Image
 from pydantic import BaseModel
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from server.core.config import (
+    DATA_ROOT,
     EMBEDDING_MODEL,
     OM_SECTIONS_PATH,
     OM_TEMPLATE_PATH,
@@ -44,13 +48,25 @@ PDF_PROMPT = (
     "Read this PDF page image and output the textual content you can see. If multiple sections exist, separate them."
 )
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/api", tags=["om"])
 
 with open(OM_SECTIONS_PATH, "r", encoding="utf-8") as fp:
     SECTION_CONFIG = json.load(fp)
 
 SECTION_DEFINITIONS = SECTION_CONFIG.get("sections", [])
-TEMPLATE = Template(Path(OM_TEMPLATE_PATH).read_text(encoding="utf-8"))
+
+# Compile the OM template once through an environment with a bytecode cache so
+# restarts skip recompilation; auto_reload stays off to avoid per-render stats.
+_TEMPLATE_CACHE_DIR = DATA_ROOT / "cache" / "jinja"
+_TEMPLATE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+_JINJA_ENV = Environment(
+    loader=FileSystemLoader(str(OM_TEMPLATE_PATH.parent)),
+    bytecode_cache=FileSystemBytecodeCache(str(_TEMPLATE_CACHE_DIR)),
+    auto_reload=False,
+)
+TEMPLATE = _JINJA_ENV.get_template(OM_TEMPLATE_PATH.name)
 
 EMBED_DIM = EMBED_DIMENSIONS.get(EMBEDDING_MODEL, 1536)
 if not VECTOR_STORE_DSN:
@@ -121,8 +137,9 @@ async def import_deal(
     for upload in files:
         safe_name = normalise_filename(upload.filename or "upload")
         target_path = inputs_dir / safe_name
-        data = await upload.read()
-        target_path.write_bytes(data)
+        # Stream to disk instead of buffering the whole upload in memory
+        with target_path.open("wb") as out:
+            await run_in_threadpool(shutil.copyfileobj, upload.file, out)
 
         document = models.Document(
             deal_id=deal.id,
@@ -179,7 +196,7 @@ async def import_deal(
 
                 document.embeddings_created = bool(chunks)
                 document.processing_status = "completed"
-                document.processed_at = datetime.utcnow()
+                document.processed_at = func.now()
             else:
                 document.processing_status = "uploaded"
         except Exception as exc:  # pragma: no cover - defensive logging
@@ -212,23 +229,25 @@ def generate_om(
     if not deal:
         raise HTTPException(status_code=404, detail="Deal not found")
 
-    documents = (
-        session.query(models.Document)
+    has_documents = (
+        session.query(models.Document.id)
         .filter(models.Document.deal_id == deal.id, models.Document.processing_status != "failed")
-        .all()
+        .first()
     )
-    if not documents:
+    if has_documents is None:
         raise HTTPException(status_code=400, detail="No processed documents available for this deal")
 
+    full_document_snippets: List[str] = []
+    if request.attach_full_documents:
+        full_document_snippets = _collect_full_documents(session, deal.id)
+
     sections_text: dict[str, str] = {}
 
     for section in SECTION_DEFINITIONS:
         section_name = section["name"]
         query_text = section["query"]
         previews = _retrieve_section_snippets(deal.id, query_text)
-
-        if request.attach_full_documents:
-            previews.extend(_collect_full_documents(documents))
+        previews.extend(full_document_snippets)
 
         try:
             generated = GEMINI.generate_section(
@@ -253,7 +272,10 @@ def generate_om(
     return OMGenerateResponse(deal_id=deal.id, markdown=rendered, output_path=str(output_path))
 
 
+@lru_cache(maxsize=10_000)
 def _embed_text(text: str) -> List[float]:
+    # Duplicate chunks (boilerplate pages, repeated section queries) reuse the
+    # cached vector instead of paying another embeddings call.
     response = OPENAI_CLIENT.embeddings.create(
         model=EMBEDDING_MODEL,
         input=text,
@@ -279,12 +301,19 @@ def _retrieve_section_snippets(deal_id: UUID, query: str) -> List[str]:
     return snippets
 
 
-def _collect_full_documents(documents: List[models.Document]) -> List[str]:
-    snippets: List[str] = []
-    for doc in documents:
-        if doc.extracted_text and len(doc.extracted_text) <= 5000:
-            snippets.append(f"[[{doc.file_name}]]\n{doc.extracted_text.strip()}")
-    return snippets
+def _collect_full_documents(session: Session, deal_id: UUID) -> List[str]:
+    # Filter on length in SQL so oversized extracted_text never leaves the DB
+    rows = (
+        session.query(models.Document.file_name, models.Document.extracted_text)
+        .filter(
+            models.Document.deal_id == deal_id,
+            models.Document.processing_status != "failed",
+            models.Document.extracted_text.isnot(None),
+            func.length(models.Document.extracted_text) <= 5000,
+        )
+        .all()
+    )
+    return [f"[[{file_name}]]\n{text.strip()}" for file_name, text in rows if text.strip()]
 
 
 def _is_image_file(suffix: str) -> bool:
@@ -305,11 +334,11 @@ def _describe_pdf_file(path: Path) -> str:
         with fitz.open(path) as doc:
             page_total = min(2, doc.page_count)
             for page_index in range(page_total):
-                image = _pdf_page_to_image(doc, page_index)
-                if image is None:
+                jpeg = _pdf_page_to_jpeg(doc, page_index)
+                if jpeg is None:
                     continue
                 try:
-                    desc = GEMINI.describe_visual(image, prompt=PDF_PROMPT)
+                    desc = GEMINI.describe_visual(jpeg, prompt=PDF_PROMPT)
                     if desc:
                         descriptions.append(desc)
                 except GeminiError as exc:
@@ -324,13 +353,12 @@ def _describe_pdf_file(path: Path) -> str:
     return "\n\n".join(descriptions).strip()
 
 
-def _pdf_page_to_image(doc: fitz.Document, page_index: int) -> Optional[Image.Image]:
+def _pdf_page_to_jpeg(doc: fitz.Document, page_index: int, *, dpi: int = 110) -> Optional[bytes]:
+    # Encode straight to JPEG bytes so we avoid a PIL round trip; 110dpi is
+    # plenty for the short-PDF preview fallback.
     try:
-        page = doc.load_page(page_index)
-        pix = page.get_pixmap(dpi=144)
-        mode = "RGBA" if pix.alpha else "RGB"
-        image = Image.frombytes(mode, [pix.width, pix.height], pix.samples)
-        return image
+        pix = doc.load_page(page_index).get_pixmap(dpi=dpi)
+        return pix.tobytes("jpeg", jpg_quality=80)
     except Exception as exc:
         logger.warning("Failed to rasterize PDF page %s: %s", page_index + 1, exc)
         return None
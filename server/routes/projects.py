@@ -8,6 +8,7 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, Field, ConfigDict
+from sqlalchemy import func
 from sqlalchemy.orm import Session, joinedload
 
 from server.core.config import DATA_ROOT
@@ -137,7 +138,7 @@ async def update_deal(
     if payload.team_id is not None:
         deal.team_id = payload.team_id
 
-    deal.updated_at = datetime.utcnow()
+    deal.updated_at = func.now()
     db.commit()
     db.refresh(deal)
     return DealResponse.model_validate(deal)
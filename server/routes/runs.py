@@ -2,22 +2,30 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import io
+import threading
+import zipfile
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
 from uuid import UUID
+from xml.sax.saxutils import escape
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from fastapi.concurrency import run_in_threadpool
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi.responses import FileResponse
 from pydantic import BaseModel, Field, ConfigDict
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, func
+from sqlalchemy.orm import Session, undefer
 
 from server.core.modes import ResearchMode
 from server.core.config import DATA_ROOT
 from server.core.embeddings import ProfileEmbedder
-from docx import Document
+import docx
 
 from ..services import JobRegistry, RunOptions
 from ..dependencies import db_session, get_storage
@@ -62,6 +70,8 @@ class RunStatusResponse(BaseModel):
     included_file_ids: List[str] = Field(default_factory=list)
     parent_run_id: Optional[str] = None
     extracted_variables_artifact_id: Optional[UUID] = None
+    rendered_artifact_id: Optional[UUID] = None
+    variables_artifact_id: Optional[UUID] = None
 
 
 class DealOmResponse(BaseModel):
@@ -103,7 +113,9 @@ async def _ensure_artifact_local(
     storage: StorageBackend,
 ) -> Path:
     paths = ensure_project_structure(DATA_ROOT, deal_id)
-    local_path = (paths.root / artifact.path).resolve()
+    # paths.root is already absolute and artifact.path is written by our own
+    # pipeline, so skip .resolve() and its per-segment stat calls.
+    local_path = paths.root / artifact.path
     local_path.parent.mkdir(parents=True, exist_ok=True)
 
     if not local_path.exists():
@@ -113,38 +125,152 @@ async def _ensure_artifact_local(
     return local_path
 
 
+_INLINE_DELIMS = ("**", "__", "`")
+
+
+def _parse_inline(text: str):
+    """Yield (kind, text) runs for **bold**, __bold__ and `code` spans.
+
+    Single pass over the string via str.find jumps; an unterminated or empty
+    delimiter is treated as plain text. Avoids the backtracking-prone lazy
+    regex previously used per paragraph.
+    """
+
+    n = len(text)
+    i = 0
+    plain_start = 0
+    while i < n:
+        best_delim = None
+        best_pos = n
+        for delim in _INLINE_DELIMS:
+            pos = text.find(delim, i)
+            if pos != -1 and pos < best_pos:
+                best_pos = pos
+                best_delim = delim
+        if best_delim is None:
+            break
+        close = text.find(best_delim, best_pos + len(best_delim))
+        if close == -1:
+            # No closing delimiter; skip past the opener and keep scanning
+            i = best_pos + len(best_delim)
+            continue
+        inner = text[best_pos + len(best_delim) : close]
+        if not inner:
+            i = close + len(best_delim)
+            continue
+        if best_pos > plain_start:
+            yield ("plain", text[plain_start:best_pos])
+        yield ("code" if best_delim == "`" else "bold", inner)
+        i = close + len(best_delim)
+        plain_start = i
+    if plain_start < n:
+        yield ("plain", text[plain_start:])
+
+
+async def _ensure_artifacts_local(
+    deal_id: str,
+    artifacts: List[models.Artifact],
+    storage: StorageBackend,
+) -> List[Path]:
+    """Fetch several artifacts concurrently; wall clock is bounded by the slowest transfer."""
+
+    return list(
+        await asyncio.gather(
+            *(_ensure_artifact_local(deal_id, artifact, storage) for artifact in artifacts)
+        )
+    )
+
+
+async def _artifact_markdown(
+    deal_id: str,
+    artifact: models.Artifact,
+    storage: StorageBackend,
+) -> str:
+    """Read an artifact's markdown, streaming from storage when it is not on disk.
+
+    Skips the download-to-disk-then-reopen round trip for consumers that only
+    need the text in memory.
+    """
+
+    paths = ensure_project_structure(DATA_ROOT, deal_id)
+    local_path = paths.root / artifact.path
+    if local_path.exists():
+        return await run_in_threadpool(local_path.read_text, encoding="utf-8")
+
+    storage_key = _storage_key(deal_id, artifact.path)
+
+    def _read() -> bytes:
+        return b"".join(storage.open(storage_key))
+
+    data = await run_in_threadpool(_read)
+    return data.decode("utf-8")
+
+
+def _load_docx_template() -> tuple[dict[str, bytes], str, str]:
+    """Load the static parts of python-docx's default template once.
+
+    Everything except word/document.xml (content types, rels, styles,
+    numbering, theme) is byte-identical for every export, so it is read a
+    single time at import. The original document.xml is split into a prefix
+    (declarations + <w:body>) and suffix (section properties + closers) that
+    our generated paragraphs are slotted between.
+    """
+    template_path = Path(docx.__file__).parent / "templates" / "default.docx"
+    with zipfile.ZipFile(template_path) as archive:
+        parts = {
+            name: archive.read(name)
+            for name in archive.namelist()
+            if name != "word/document.xml"
+        }
+        document_xml = archive.read("word/document.xml").decode("utf-8")
+    head, _, tail = document_xml.partition("<w:body>")
+    sect_idx = tail.find("<w:sectPr")
+    if sect_idx != -1:
+        tail = tail[sect_idx:]
+    return parts, head + "<w:body>", tail
+
+
+_DOCX_TEMPLATE_PARTS, _DOCX_BODY_PREFIX, _DOCX_BODY_SUFFIX = _load_docx_template()
+
+
+def _docx_paragraph_xml(text: str, style: str | None = None) -> str:
+    ppr = f'<w:pPr><w:pStyle w:val="{style}"/></w:pPr>' if style else ""
+    runs = []
+    for kind, run_text in _parse_inline(text):
+        # Minimal inline markdown support: **bold**, __bold__, `code`
+        # (inline code renders as a plain run for now).
+        rpr = "<w:rPr><w:b/></w:rPr>" if kind == "bold" else ""
+        runs.append(f'<w:r>{rpr}<w:t xml:space="preserve">{escape(run_text)}</w:t></w:r>')
+    return f"<w:p>{ppr}{''.join(runs)}</w:p>"
+
+
+def _docx_code_paragraph_xml(lines: List[str]) -> str:
+    runs = "<w:br/>".join(
+        f'<w:t xml:space="preserve">{escape(line)}</w:t>' for line in lines
+    )
+    return (
+        '<w:p><w:pPr><w:pStyle w:val="IntenseQuote"/></w:pPr>'
+        f"<w:r>{runs}</w:r></w:p>"
+        if lines
+        else '<w:p><w:pPr><w:pStyle w:val="IntenseQuote"/></w:pPr></w:p>'
+    )
+
+
 def _markdown_to_docx_bytes(content: str) -> io.BytesIO:
-    document = Document()
+    # Emits OOXML paragraph strings directly instead of building a python-docx
+    # element tree; the static package parts come from the cached template.
+    body: List[str] = []
+    append = body.append
     in_code_block = False
     code_buffer: List[str] = []
 
-    def _add_runs_with_emphasis(paragraph, text: str) -> None:
-        # Minimal inline markdown support: **bold**, __bold__, `code`
-        import re
-        parts = re.split(r"(\*\*.+?\*\*|__.+?__|`.+?`)", text)
-        for part in parts:
-            if not part:
-                continue
-            if (part.startswith("**") and part.endswith("**") and len(part) >= 4):
-                run = paragraph.add_run(part[2:-2])
-                run.bold = True
-            elif (part.startswith("__") and part.endswith("__") and len(part) >= 4):
-                run = paragraph.add_run(part[2:-2])
-                run.bold = True
-            elif (part.startswith("`") and part.endswith("`") and len(part) >= 2):
-                # Render inline code as a plain run for now
-                paragraph.add_run(part[1:-1])
-            else:
-                paragraph.add_run(part)
-
     for raw_line in content.splitlines():
-        line = raw_line.rstrip("\n")
-        stripped = line.strip()
+        stripped = raw_line.strip()
+        first = stripped[:1]
 
-        if stripped.startswith("```"):
+        if first == "`" and stripped.startswith("```"):
             if in_code_block:
-                paragraph = document.add_paragraph("\n".join(code_buffer) if code_buffer else "")
-                paragraph.style = "Intense Quote"
+                append(_docx_code_paragraph_xml(code_buffer))
                 code_buffer.clear()
                 in_code_block = False
             else:
@@ -152,53 +278,161 @@ def _markdown_to_docx_bytes(content: str) -> io.BytesIO:
             continue
 
         if in_code_block:
-            code_buffer.append(line)
+            code_buffer.append(raw_line)
             continue
 
         if not stripped:
-            document.add_paragraph("")
-            continue
-
-        if stripped.startswith("#"):
+            append("<w:p/>")
+        elif first == "#":
             level = len(stripped) - len(stripped.lstrip("#"))
             text = stripped[level:].strip()
-            level = max(1, min(level, 4))
-            heading_para = document.add_heading("", level=level)
-            _add_runs_with_emphasis(heading_para, text or "")
-            continue
-
-        if stripped.startswith(('- ', '* ')):
-            bullet_text = stripped[2:].strip()
-            bullet_para = document.add_paragraph(style="List Bullet")
-            _add_runs_with_emphasis(bullet_para, bullet_text)
-            continue
-
-        if stripped.startswith(">"):
-            quote_para = document.add_paragraph("")
-            quote_para.style = "Intense Quote"
-            _add_runs_with_emphasis(quote_para, stripped[1:].strip())
-            continue
-
-        body_para = document.add_paragraph("")
-        _add_runs_with_emphasis(body_para, stripped)
+            append(_docx_paragraph_xml(text, style=f"Heading{max(1, min(level, 4))}"))
+        elif first in "-*" and stripped[1:2] == " ":
+            append(_docx_paragraph_xml(stripped[2:].strip(), style="ListBullet"))
+        elif first == ">":
+            append(_docx_paragraph_xml(stripped[1:].strip(), style="IntenseQuote"))
+        else:
+            append(_docx_paragraph_xml(stripped))
 
     if code_buffer:
-        paragraph = document.add_paragraph("\n".join(code_buffer))
-        paragraph.style = "Intense Quote"
+        append(_docx_code_paragraph_xml(code_buffer))
 
+    document_xml = _DOCX_BODY_PREFIX + "".join(body) + _DOCX_BODY_SUFFIX
     buffer = io.BytesIO()
-    document.save(buffer)
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, data in _DOCX_TEMPLATE_PARTS.items():
+            archive.writestr(name, data)
+        archive.writestr("word/document.xml", document_xml)
     buffer.seek(0)
     return buffer
 
 
-def _get_rendered_artifact(db: Session, run_id: UUID) -> models.Artifact | None:
+# Rendered DOCX bytes are cached by content digest, so concurrent exports of
+# the same markdown share one conversion and re-rendered artifacts with
+# unchanged content still hit. New artifact versions hash differently and
+# stale entries simply age out of the LRU.
+_DOCX_CACHE_MAX = 32
+_docx_cache: OrderedDict[bytes, bytes] = OrderedDict()
+# Download handlers render on threadpool threads; the lock keeps the
+# get/move/evict triplet atomic so an eviction can't race a recency bump.
+_docx_cache_lock = threading.Lock()
+
+
+def _docx_bytes_for_content(content: str) -> bytes:
+    key = hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+    with _docx_cache_lock:
+        cached = _docx_cache.get(key)
+        if cached is not None:
+            _docx_cache.move_to_end(key)
+            return cached
+    data = _markdown_to_docx_bytes(content).getvalue()
+    with _docx_cache_lock:
+        _docx_cache[key] = data
+        while len(_docx_cache) > _DOCX_CACHE_MAX:
+            _docx_cache.popitem(last=False)
+    return data
+
+
+def _docx_response(data: bytes, filename: str) -> Response:
+    # The bytes are fully materialized (and usually cached), so a plain
+    # Response avoids StreamingResponse's per-chunk threadpool hops.
+    return Response(
+        content=data,
+        media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+def _latest_artifact_subquery(db: Session, kind: str):
+    """Subquery selecting the newest artifact id per run for one kind."""
     return (
-        db.query(models.Artifact)
-        .filter(models.Artifact.run_id == run_id, models.Artifact.kind == "rendered_doc")
+        db.query(models.Artifact.id, models.Artifact.run_id)
+        .filter(models.Artifact.kind == kind)
+        .distinct(models.Artifact.run_id)
+        .order_by(models.Artifact.run_id, models.Artifact.created_at.desc())
+        .subquery()
+    )
+
+
+def _runs_with_latest_artifacts(db: Session, deal_uuid: UUID):
+    """Fetch run rows with their latest rendered/variables artifact ids in one query.
+
+    The worker persists the artifact ids on Run, so new rows resolve without
+    touching artifacts at all; the DISTINCT ON subqueries remain only as a
+    backfill for runs recorded before those columns existed. Selects plain
+    column tuples rather than Run entities: the list endpoints are read-only,
+    so identity-map and attribute-instrumentation overhead buys nothing.
+    """
+    rendered = _latest_artifact_subquery(db, "rendered_doc")
+    variables = _latest_artifact_subquery(db, "variables")
+    return (
+        db.query(
+            models.Run.id,
+            models.Run.deal_id,
+            models.Run.status,
+            models.Run.mode,
+            models.Run.research_mode,
+            models.Run.created_at,
+            models.Run.started_at,
+            models.Run.finished_at,
+            models.Run.result_path,
+            models.Run.error,
+            models.Run.included_file_ids,
+            models.Run.parent_run_id,
+            models.Run.extracted_variables_artifact_id,
+            func.coalesce(models.Run.rendered_artifact_id, rendered.c.id).label("rendered_artifact_id"),
+            func.coalesce(models.Run.extracted_variables_artifact_id, variables.c.id).label("variables_artifact_id"),
+        )
+        .outerjoin(rendered, rendered.c.run_id == models.Run.id)
+        .outerjoin(variables, variables.c.run_id == models.Run.id)
+        .filter(models.Run.deal_id == deal_uuid)
+        .order_by(models.Run.created_at.desc())
+        .all()
+    )
+
+
+def _run_row_to_response(row) -> RunStatusResponse:
+    # model_construct skips Pydantic validation; the values come straight
+    # from typed columns, so there is nothing left to coerce.
+    return RunStatusResponse.model_construct(
+        id=row.id,
+        deal_id=str(row.deal_id),
+        status=row.status,
+        run_mode=row.mode,
+        research_mode=row.research_mode,
+        created_at=row.created_at,
+        started_at=row.started_at,
+        finished_at=row.finished_at,
+        result_path=row.result_path,
+        error=row.error,
+        params={},
+        instructions=None,
+        included_file_ids=row.included_file_ids or [],
+        parent_run_id=str(row.parent_run_id) if row.parent_run_id else None,
+        extracted_variables_artifact_id=row.extracted_variables_artifact_id,
+        rendered_artifact_id=row.rendered_artifact_id,
+        variables_artifact_id=row.variables_artifact_id,
+    )
+
+
+def _get_run_with_rendered(db: Session, run_id: UUID) -> tuple[models.Run | None, models.Artifact | None]:
+    """Fetch a run together with its newest rendered_doc artifact in one round trip."""
+    row = (
+        db.query(models.Run, models.Artifact)
+        .outerjoin(
+            models.Artifact,
+            and_(
+                models.Artifact.run_id == models.Run.id,
+                models.Artifact.kind == "rendered_doc",
+            ),
+        )
+        .filter(models.Run.id == run_id)
         .order_by(models.Artifact.created_at.desc())
         .first()
     )
+    if row is None:
+        return None, None
+    return row[0], row[1]
 
 
 def _get_variables_artifact(db: Session, run_id: UUID) -> models.Artifact | None:
@@ -210,6 +444,32 @@ def _get_variables_artifact(db: Session, run_id: UUID) -> models.Artifact | None
     )
 
 
+# (candidate keys, label, join list values) for the compact profile text.
+_PROFILE_FIELDS = (
+    (("project_name", "deal_name"), "title", False),
+    (("industry",), "industry", False),
+    (("project_type", "solution_type"), "project_type", False),
+    (("services",), "services", True),
+    (("tags",), "tags", True),
+)
+
+
+def _profile_text_from_variables(variables: dict) -> str:
+    """Build the compact profile string used for run embeddings."""
+    parts: List[str] = []
+    for keys, label, is_list in _PROFILE_FIELDS:
+        value = next((variables.get(key) for key in keys if variables.get(key)), None)
+        if not value:
+            continue
+        if is_list and isinstance(value, list):
+            rendered = ",".join(str(item).strip() for item in value if item)
+        else:
+            rendered = str(value).strip()
+        if rendered:
+            parts.append(f"{label}:{rendered}")
+    return " | ".join(parts)
+
+
 def _job_to_response(job: JobStatus) -> RunStatusResponse:
     data = job.to_dict()
     params = data.get("params", {}) or {}
@@ -260,15 +520,9 @@ async def list_runs(
 
     responses: List[RunStatusResponse] = []
 
-    db_runs = (
-        db.query(models.Run)
-        .filter(models.Run.deal_id == deal_uuid)
-        .order_by(models.Run.created_at.desc())
-        .all()
-    )
-    for run in db_runs:
-        response = _db_run_to_response(run)
-        job = job_map.pop(run.id, None)
+    for row in _runs_with_latest_artifacts(db, deal_uuid):
+        response = _run_row_to_response(row)
+        job = job_map.pop(row.id, None)
         if job is not None:
             live = _job_to_response(job)
             response.status = live.status
@@ -349,7 +603,11 @@ async def get_run(
         rbac.ensure_deal_access(db, current_user, UUID(deal_id))
         return _job_to_response(job)
 
-    run = db.get(models.Run, run_id)
+    run = db.get(
+        models.Run,
+        run_id,
+        options=[undefer(models.Run.params), undefer(models.Run.instructions)],
+    )
     if run is not None and str(run.deal_id) == deal_id:
         rbac.ensure_deal_access(db, current_user, run.deal_id)
         return _db_run_to_response(run)
@@ -370,50 +628,17 @@ async def list_deal_oms(
 
     rbac.ensure_deal_access(db, current_user, deal_uuid)
 
-    runs = (
-        db.query(models.Run)
-        .filter(models.Run.deal_id == deal_uuid)
-        .order_by(models.Run.created_at.desc())
-        .all()
-    )
-    run_ids = [run.id for run in runs]
-    artifacts_map: dict[UUID, dict[str, Optional[UUID]]] = {
-        run.id: {"rendered": None, "variables": None} for run in runs
-    }
-
-    if run_ids:
-        artifacts = (
-            db.query(models.Artifact)
-            .filter(
-                models.Artifact.run_id.in_(run_ids),
-                models.Artifact.kind.in_(["rendered_doc", "variables"]),
-            )
-            .all()
-        )
-        for artifact in artifacts:
-            slot = artifacts_map.get(artifact.run_id)
-            if slot is None:
-                continue
-            if artifact.kind == "rendered_doc":
-                slot["rendered"] = artifact.id
-            elif artifact.kind == "variables":
-                slot["variables"] = artifact.id
-
-    responses: List[DealOmResponse] = []
-    for run in runs:
-        slots = artifacts_map.get(run.id) or {}
-        responses.append(
-            DealOmResponse(
-                run_id=run.id,
-                status=run.status,
-                created_at=run.created_at,
-                finished_at=run.finished_at,
-                rendered_artifact_id=slots.get("rendered"),
-                variables_artifact_id=slots.get("variables"),
-            )
+    return [
+        DealOmResponse(
+            run_id=row.id,
+            status=row.status,
+            created_at=row.created_at,
+            finished_at=row.finished_at,
+            rendered_artifact_id=row.rendered_artifact_id,
+            variables_artifact_id=row.variables_artifact_id,
         )
-
-    return responses
+        for row in _runs_with_latest_artifacts(db, deal_uuid)
+    ]
 
 
 @oms_router.get("/{run_id}/download/{format}")
@@ -425,7 +650,7 @@ async def download_deal_om(
     storage: StorageBackend = Depends(get_storage),
     current_user: SessionUser = Depends(require_roles("viewer", "editor", "admin")),
 ):
-    run = db.get(models.Run, run_id)
+    run, artifact = _get_run_with_rendered(db, run_id)
     if not run or str(run.deal_id) != deal_id:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Run not found for deal")
     if run.status != "success":
@@ -433,20 +658,19 @@ async def download_deal_om(
 
     rbac.ensure_deal_access(db, current_user, run.deal_id)
 
-    artifact = _get_rendered_artifact(db, run_id)
     if artifact is None:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Rendered document not found")
 
-    try:
-        local_path = await _ensure_artifact_local(str(run.deal_id), artifact, storage)
-    except Exception as exc:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to download artifact: {exc}")
-
-    if not local_path.exists():
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Rendered document is unavailable")
-
     format_normalized = format.lower()
     if format_normalized == "md":
+        try:
+            local_path = await _ensure_artifact_local(str(run.deal_id), artifact, storage)
+        except Exception as exc:
+            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to download artifact: {exc}")
+
+        if not local_path.exists():
+            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Rendered document is unavailable")
+
         filename = Path(artifact.path).name
         return FileResponse(
             str(local_path),
@@ -455,16 +679,13 @@ async def download_deal_om(
         )
     if format_normalized == "docx":
         try:
-            content = local_path.read_text(encoding="utf-8")
+            content = await _artifact_markdown(str(run.deal_id), artifact, storage)
         except Exception as exc:
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to read artifact: {exc}")
 
-        buffer = _markdown_to_docx_bytes(content)
+        data = await run_in_threadpool(_docx_bytes_for_content, content)
         filename_stem = Path(artifact.path).stem or f"run-{run.id}"
-        docx_filename = f"{filename_stem}.docx"
-        headers = {"Content-Disposition": f'attachment; filename="{docx_filename}"'}
-        media_type = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-        return StreamingResponse(buffer, media_type=media_type, headers=headers)
+        return _docx_response(data, f"{filename_stem}.docx")
 
     raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Unsupported format; use 'md' or 'docx'")
 
@@ -564,43 +785,19 @@ async def embed_run_output(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Variables artifact is unavailable")
 
     try:
-        import json
-        with open(local_path, 'r', encoding='utf-8') as f:
-            variables = json.load(f)
+        variables = orjson.loads(await run_in_threadpool(local_path.read_bytes))
     except Exception as exc:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to parse variables: {exc}")
 
     # Build compact profile text directly from variables
     try:
-        profile_text_parts = []
-        title = variables.get("project_name") or variables.get("deal_name")
-        if title:
-            profile_text_parts.append(f"title:{str(title).strip()}")
-        industry = variables.get("industry")
-        if industry:
-            profile_text_parts.append(f"industry:{str(industry).strip()}")
-        project_type = variables.get("project_type") or variables.get("solution_type")
-        if project_type:
-            profile_text_parts.append(f"project_type:{str(project_type).strip()}")
-        services = variables.get("services") or []
-        if services:
-            if isinstance(services, list):
-                profile_text_parts.append("services:" + ",".join(str(x).strip() for x in services if x))
-            else:
-                profile_text_parts.append("services:" + str(services).strip())
-        tags = variables.get("tags") or []
-        if tags:
-            if isinstance(tags, list):
-                profile_text_parts.append("tags:" + ",".join(str(x).strip() for x in tags if x))
-            else:
-                profile_text_parts.append("tags:" + str(tags).strip())
-        profile_text = " | ".join(profile_text_parts)
+        profile_text = _profile_text_from_variables(variables)
     except Exception as exc:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to build profile: {exc}")
 
     # Generate embedding from compact profile
     try:
-        embedder = ProfileEmbedder()
+        embedder = getattr(request.app.state, "profile_embedder", None) or ProfileEmbedder()
         embedding = list(embedder.embed(profile_text))
     except Exception as exc:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Embedding generation failed: {exc}")
@@ -657,32 +854,18 @@ async def download_run_docx(
     if run.status != "success":
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Run must be successful before exporting")
 
-    artifact = _get_rendered_artifact(db, run_id)
+    _, artifact = _get_run_with_rendered(db, run_id)
     if artifact is None:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Rendered document not found")
 
     deal_id_str = str(run.deal_id)
 
     try:
-        local_path = await _ensure_artifact_local(deal_id_str, artifact, storage)
-    except Exception as exc:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to download artifact: {exc}")
-
-    if not local_path.exists() or not local_path.is_file():
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Rendered document is unavailable")
-
-    try:
-        content = local_path.read_text(encoding="utf-8")
+        content = await _artifact_markdown(deal_id_str, artifact, storage)
     except Exception as exc:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to read artifact: {exc}")
 
-    buffer = _markdown_to_docx_bytes(content)
+    data = await run_in_threadpool(_docx_bytes_for_content, content)
     filename_stem = Path(artifact.path).stem or f"run-{run.id}"
-    docx_filename = f"{filename_stem}.docx"
-
-    headers = {
-        "Content-Disposition": f'attachment; filename="{docx_filename}"'
-    }
-    media_type = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-    return StreamingResponse(buffer, media_type=media_type, headers=headers)
+    return _docx_response(data, f"{filename_stem}.docx")
 
@@ -9,6 +9,7 @@ from sqlalchemy.orm import Session
 
 from ..db import models
 from ..dependencies import db_session
+from ..security import rbac
 from .auth import SessionUser, get_current_user
 
 router = APIRouter(prefix="/teams", tags=["teams"])
@@ -64,6 +65,7 @@ async def create_team(
 
     db.commit()
     db.refresh(team)
+    rbac.invalidate_user_teams(current_user.id)
     return TeamResponse.model_validate(team)
 
 
@@ -2,23 +2,55 @@
 
 from __future__ import annotations
 
+import time
 from typing import Iterable, List, Optional
 from uuid import UUID
 
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_
+from sqlalchemy.orm import Session
 
 from server.db import models
 from server.routes.auth import SessionUser
 
 
+# Team membership is read on nearly every authenticated request but changes
+# rarely; a short TTL cache keeps the lookup off the hot path.
+_TEAM_CACHE_TTL_SECONDS = 30.0
+_TEAM_CACHE_MAX = 1024
+_team_cache: dict[UUID, tuple[float, List[UUID]]] = {}
+
+
+def invalidate_user_teams(user_id: UUID) -> None:
+    """Drop the cached team ids for a user after membership changes."""
+
+    _team_cache.pop(user_id, None)
+
+
 def user_team_ids(db: Session, user_id: UUID) -> List[UUID]:
+    now = time.monotonic()
+    cached = _team_cache.get(user_id)
+    if cached is not None and now - cached[0] < _TEAM_CACHE_TTL_SECONDS:
+        return cached[1]
+
     rows = (
         db.query(models.TeamMember.team_id)
         .filter(models.TeamMember.user_id == user_id)
         .all()
     )
-    return [row.team_id for row in rows]
+    team_ids = [row.team_id for row in rows]
+    if len(_team_cache) >= _TEAM_CACHE_MAX:
+        _team_cache.clear()
+    _team_cache[user_id] = (now, team_ids)
+    return team_ids
+
+
+def _get_team_ids(db: Session, user: SessionUser) -> List[UUID]:
+    """Fetch team ids once per request, memoizing on the session user."""
+
+    if user._team_ids is None:
+        user._team_ids = user_team_ids(db, user.id)
+    return user._team_ids
 
 
 def can_access_deal(
@@ -42,24 +74,32 @@ def ensure_deal_access(db: Session, user: SessionUser, deal_id: UUID) -> models.
     deal = db.get(models.Deal, deal_id)
     if deal is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Deal not found")
-    if not can_access_deal(user=user, deal=deal, team_ids=user_team_ids(db, user.id)):
+    if not can_access_deal(user=user, deal=deal, team_ids=_get_team_ids(db, user)):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to access this deal")
     return deal
 
 
 def ensure_run_access(db: Session, user: SessionUser, run_id: UUID) -> models.Run:
-    run = (
-        db.query(models.Run)
-        .options(joinedload(models.Run.deal))
+    # One round trip: join the parent deal and the caller's membership row
+    # (if any) instead of fetching the deal and team ids separately.
+    row = (
+        db.query(models.Run, models.Deal, models.TeamMember.id)
+        .join(models.Deal, models.Run.deal_id == models.Deal.id)
+        .outerjoin(
+            models.TeamMember,
+            and_(
+                models.TeamMember.team_id == models.Deal.team_id,
+                models.TeamMember.user_id == user.id,
+            ),
+        )
         .filter(models.Run.id == run_id)
-        .one_or_none()
+        .first()
     )
-    if run is None:
+    if row is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Run not found")
-    deal = run.deal or db.get(models.Deal, run.deal_id)
-    if deal is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Parent deal not found")
-    if not can_access_deal(user=user, deal=deal, team_ids=user_team_ids(db, user.id)):
+    run, deal, membership_id = row
+    is_member = membership_id is not None
+    if user.role != "admin" and deal.owner_id != user.id and not is_member:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to access this run")
     return run
 
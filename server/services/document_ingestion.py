@@ -2,27 +2,73 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import logging
-from concurrent.futures import ThreadPoolExecutor
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 from uuid import UUID
 
-from openai import OpenAI
+import httpx
+import numpy as np
+from openai import OpenAI, RateLimitError
 from PyPDF2 import PdfReader
+from sqlalchemy import update
 from sqlalchemy.orm import joinedload
 
 from ..core.config import DATA_ROOT, EMBEDDING_MODEL
-from ..core.extraction import extract_text, chunk_text
+from ..core.extraction import (
+    chunk_text,
+    extract_pdf_page_range,
+    extract_text,
+    pdf_page_count,
+)
 from ..db import models
 from ..db.models import utcnow
 from ..db.session import get_session
-from ..services.vector_store import VectorStore
+from ..services.vector_store import VectorStore, VectorStoreError
 from ..storage.projects import ensure_project_structure
 
 LOGGER = logging.getLogger(__name__)
 
 
+# Boilerplate chunks (legal footers, cover pages) repeat across documents;
+# cache their embeddings by content hash so duplicates skip the API call.
+_EMBED_CACHE_MAX = 10_000
+
+# Chunks per embeddings.create call; amortises the HTTPS round trip that
+# otherwise dominates ingestion wall time.
+_EMBED_BATCH_SIZE = 96
+
+# In-flight embedding batches; the workload is latency-bound, so overlapping
+# a few requests divides wall time without denting the rate limit.
+_EMBED_MAX_PARALLEL = 4
+
+# How long a partial batch waits for chunks from other in-flight documents
+# before flushing; an upload burst then shares batches across documents.
+_EMBED_FLUSH_INTERVAL = 0.05
+
+# Extraction strategy tiers, picked from estimated page count: dispatching a
+# tiny PDF to a pool costs more than just extracting it, while very large
+# PDFs want real cores rather than GIL-shared threads.
+_STRATEGY_SEQUENTIAL = "sequential"
+_STRATEGY_THREADED = "threaded"
+_STRATEGY_PROCESS = "process"
+
+_SEQUENTIAL_MAX_PAGES = 10
+_THREADED_MAX_PAGES = 200
+
+# Pages handed to each extraction worker, and the rough on-disk size of a
+# text-heavy PDF page used to estimate page count without opening the file.
+_EXTRACT_BATCH_PAGES = 10
+_PDF_PAGE_ESTIMATE_BYTES = 100 * 1024
+
 _SUPPORTED_IMG_EXTENSIONS = {
     ".jpeg",
     ".jpg",
@@ -38,10 +84,51 @@ class DocumentIngestionService:
     def __init__(self, *, vector_store: VectorStore, max_workers: int = 2) -> None:
         self._vector_store = vector_store
         self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="doc-ingest")
-        self._openai = OpenAI()
+        self._embed_executor = ThreadPoolExecutor(max_workers=_EMBED_MAX_PARALLEL, thread_name_prefix="doc-embed")
+        # CPU-bound parsing and chunking run here so documents parse on real
+        # cores; the thread pool above keeps DB sessions and API I/O affine
+        # to one thread per job.
+        self._cpu_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        # HTTP/2 with generous keep-alive: the parallel embedding batches
+        # multiplex over one TLS connection instead of each opening their own,
+        # and idle connections survive between upload bursts.
+        self._openai = OpenAI(
+            http_client=httpx.Client(
+                http2=True,
+                limits=httpx.Limits(
+                    max_keepalive_connections=20,
+                    max_connections=50,
+                    keepalive_expiry=60,
+                ),
+            )
+        )
+        self._embedding_cache: OrderedDict[bytes, np.ndarray] = OrderedDict()
+        # Ingestion worker threads share the cache; the lock keeps lookups'
+        # recency bumps and insert-time eviction from racing each other.
+        self._embedding_cache_lock = threading.Lock()
+        # Coalescing queue: chunks from all in-flight documents merge into
+        # shared batches, drained by a single flusher thread.
+        self._embed_queue: "queue.Queue[tuple[str, Future]]" = queue.Queue()
+        self._embed_stop = threading.Event()
+        self._embed_flusher = threading.Thread(
+            target=self._drain_embed_queue, name="doc-embed-flush", daemon=True
+        )
+        self._embed_flusher.start()
 
     def shutdown(self) -> None:
+        self._embed_stop.set()
         self._executor.shutdown(wait=False, cancel_futures=True)
+        self._embed_executor.shutdown(wait=False, cancel_futures=True)
+        self._cpu_pool.shutdown(wait=False, cancel_futures=True)
+        # Resolve whatever never reached the flusher so no _embed_chunks
+        # caller stays blocked in future.result() past shutdown.
+        while True:
+            try:
+                _, future = self._embed_queue.get_nowait()
+            except queue.Empty:
+                break
+            if not future.done():
+                future.set_result(None)
 
     def enqueue(self, deal_id: UUID, document_id: UUID) -> models.DocumentIngestionJob:
         with get_session() as session:
@@ -58,7 +145,17 @@ class DocumentIngestionService:
                 session.query(models.DocumentIngestionJob)
                 .filter(models.DocumentIngestionJob.id == job_id)
                 .options(
-                    joinedload(models.DocumentIngestionJob.document).joinedload(models.Document.deal),
+                    # Only the columns ingestion actually reads; documents
+                    # carry extracted_text and deals carry large JSON blobs
+                    # that would otherwise ride along on every job.
+                    joinedload(models.DocumentIngestionJob.document)
+                    .load_only(
+                        models.Document.file_name,
+                        models.Document.file_type,
+                        models.Document.file_path,
+                    )
+                    .joinedload(models.Document.deal)
+                    .load_only(models.Deal.company_name),
                 )
                 .one_or_none()
             )
@@ -71,97 +168,368 @@ class DocumentIngestionService:
             job.started_at = utcnow()
             document = job.document
             deal = document.deal
-            session.flush()
+            ingest_args = {
+                "deal_id": deal.id,
+                "company_name": deal.company_name,
+                "document_id": document.id,
+                "file_name": document.file_name,
+                "file_type": document.file_type,
+                "file_path": document.file_path,
+            }
+            session.commit()
 
-            try:
-                self._ingest_document(deal=deal, document=document)
-            except Exception as exc:  # pragma: no cover - defensive logging
-                LOGGER.exception("Ingestion job %s failed: %s", job_id, exc)
-                job.status = "failed"
-                job.error = str(exc)
-                job.finished_at = utcnow()
-                document.processing_status = "failed"
-                document.processing_error = str(exc)
-                session.commit()
-                return
+        # The session - and its pooled connection - is released while the
+        # slow extraction and embedding I/O runs. Holding one connection per
+        # in-flight job for minutes starves the small shared pool the API
+        # request handlers draw from.
+        error: Optional[str] = None
+        try:
+            updates = self._ingest_document(**ingest_args)
+        except Exception as exc:  # pragma: no cover - defensive logging
+            LOGGER.exception("Ingestion job %s failed: %s", job_id, exc)
+            updates = {"processing_status": "failed", "processing_error": str(exc)}
+            error = str(exc)
 
-            job.status = "succeeded"
-            job.error = None
-            job.finished_at = utcnow()
-            session.commit()
+        # Targeted UPDATEs: no need to load the rows back just to write a
+        # handful of columns through identity-map dirty tracking.
+        with get_session() as session:
+            if updates:
+                session.execute(
+                    update(models.Document)
+                    .where(models.Document.id == ingest_args["document_id"])
+                    .values(**updates)
+                )
+            session.execute(
+                update(models.DocumentIngestionJob)
+                .where(models.DocumentIngestionJob.id == job_id)
+                .values(
+                    status="failed" if error else "succeeded",
+                    error=error,
+                    finished_at=utcnow(),
+                )
+            )
+
+    def _ingest_document(
+        self,
+        *,
+        deal_id: UUID,
+        company_name: str,
+        document_id: UUID,
+        file_name: str,
+        file_type: Optional[str],
+        file_path: Optional[str],
+    ) -> dict:
+        """Extract, embed and store one document; returns Document field updates.
 
-    def _ingest_document(self, *, deal: models.Deal, document: models.Document) -> None:
-        paths = ensure_project_structure(DATA_ROOT, str(deal.id))
-        if not document.file_path:
+        Works on plain values rather than ORM instances so no session has to
+        stay open - or detached objects refreshed - across the slow part.
+        """
+        paths = ensure_project_structure(DATA_ROOT, str(deal_id))
+        if not file_path:
             raise ValueError("Document is missing file path for ingestion")
-        source_path = paths.root / document.file_path
+        source_path = paths.root / file_path
         if not source_path.exists():
             raise FileNotFoundError(f"Document source missing on disk: {source_path}")
 
-        suffix = Path(document.file_name).suffix.lower()
-        extracted = extract_text(source_path)
+        suffix = Path(file_name).suffix.lower()
+        extracted = ""
+        chunks: Optional[list[str]] = None
+        strategy = _choose_strategy(source_path) if suffix == ".pdf" else _STRATEGY_SEQUENTIAL
+        if strategy != _STRATEGY_SEQUENTIAL:
+            extracted = self._extract_pdf_parallel(source_path, strategy)
+        if not extracted:
+            # Parsing and chunking are CPU bound, so they run in the process
+            # pool; only the picklable path crosses the boundary while the
+            # ORM objects stay on this thread.
+            extracted, chunks = self._cpu_pool.submit(_extract_and_chunk, source_path).result()
         if suffix == ".pdf" and (not extracted or len(extracted.strip()) < 50):
-            fallback = _pdf_text_fallback(source_path)
+            # Different-engine retry on the first pages; PyPDF2 sometimes
+            # reads text the C parsers missed.
+            fallback = _pdf_text_fallback(source_path, file_name)
             if fallback:
                 extracted = fallback
+                chunks = None
         if suffix in _SUPPORTED_IMG_EXTENSIONS and not extracted:
-            extracted = f"[Image: {document.file_name}]"
+            extracted = f"[Image: {file_name}]"
 
         if not extracted:
-            document.processing_status = "uploaded"
-            document.processing_error = "No text extracted"
-            return
+            return {"processing_status": "uploaded", "processing_error": "No text extracted"}
+
+        if chunks is None:
+            chunks = chunk_text(extracted)
+
+        hashes = [hashlib.sha256(chunk.encode("utf-8", errors="ignore")).digest() for chunk in chunks]
+        embeddings = self._embed_chunks(chunks, hashes, file_name)
+
+        rows = [
+            {
+                "deal_id": deal_id,
+                "document_id": document_id,
+                "content": chunk,
+                "embedding": embedding,
+                "company_name": company_name,
+                "file_name": file_name,
+                "file_type": file_type or "text",
+                "chunk_index": idx,
+                "chunk_size": len(chunk),
+                "content_hash": hashes[idx].hex(),
+            }
+            for idx, (chunk, embedding) in enumerate(zip(chunks, embeddings))
+            if embedding is not None
+        ]
+        if rows:
+            self._vector_store.insert_embeddings_bulk(rows)
+
+        return {
+            "extracted_text": extracted,
+            "text_extracted": True,
+            "text_chunks_count": len(chunks),
+            "embeddings_created": bool(chunks),
+            "processing_status": "completed" if chunks else "processed",
+            "processed_at": utcnow(),
+            "processing_error": None,
+        }
 
-        document.extracted_text = extracted
-        document.text_extracted = True
-        chunks = chunk_text(extracted)
-        document.text_chunks_count = len(chunks)
+    def _extract_pdf_parallel(self, path: Path, strategy: str) -> str:
+        """Extract a large PDF in page-range batches across threads or processes.
+
+        Returns an empty string when the document turns out to be small or the
+        parallel path fails, so the caller falls back to plain extraction.
+        """
+        page_count = pdf_page_count(path)
+        if page_count <= _SEQUENTIAL_MAX_PAGES:
+            return ""
+
+        starts = list(range(0, page_count, _EXTRACT_BATCH_PAGES))
+        stops = [min(start + _EXTRACT_BATCH_PAGES, page_count) for start in starts]
+        try:
+            if strategy == _STRATEGY_PROCESS:
+                batches = list(
+                    self._cpu_pool.map(extract_pdf_page_range, [path] * len(starts), starts, stops)
+                )
+            else:
+                with ThreadPoolExecutor(max_workers=min(len(starts), 4)) as pool:
+                    batches = list(pool.map(extract_pdf_page_range, [path] * len(starts), starts, stops))
+        except Exception as exc:
+            LOGGER.warning("Parallel PDF extraction failed for %s: %s", path.name, exc)
+            return ""
+
+        pages = [page for batch in batches for page in batch]
+        return "\n\n".join(pages).strip()
+
+    def _embed_chunks(
+        self,
+        chunks: list[str],
+        hashes: list[bytes],
+        file_name: str,
+    ) -> list[Optional[np.ndarray]]:
+        """Embed all chunks of a document through the shared coalescing queue.
+
+        Cache hits are resolved up front; misses are queued so chunks from
+        concurrently-ingesting documents fold into shared batches instead of
+        one undersized request per document. Failed chunks come back as
+        ``None`` so callers keep the skip semantics.
+        """
+        embeddings: list[Optional[np.ndarray]] = [None] * len(chunks)
+        waiting: list[tuple[int, Future]] = []
+        for idx, key in enumerate(hashes):
+            with self._embedding_cache_lock:
+                cached = self._embedding_cache.get(key)
+                if cached is not None:
+                    self._embedding_cache.move_to_end(key)
+            if cached is not None:
+                embeddings[idx] = cached
+                continue
+            stored = self._lookup_stored_embedding(key)
+            if stored is not None:
+                embeddings[idx] = stored
+                self._cache_embedding(key, stored)
+            else:
+                waiting.append((idx, self._submit_for_embedding(chunks[idx])))
 
-        for idx, chunk in enumerate(chunks):
+        for idx, future in waiting:
+            embedding = future.result()
+            if embedding is None:
+                LOGGER.warning("Embedding failed for chunk %s of %s", idx, file_name)
+                continue
+            embeddings[idx] = embedding
+            self._cache_embedding(hashes[idx], embedding)
+        return embeddings
+
+    def _lookup_stored_embedding(self, key: bytes) -> Optional[np.ndarray]:
+        """Best-effort reuse of a vector already stored for identical text."""
+        try:
+            return self._vector_store.lookup_embedding_by_hash(key.hex())
+        except VectorStoreError as exc:
+            LOGGER.debug("Embedding hash lookup failed: %s", exc)
+            return None
+
+    def _submit_for_embedding(self, text: str) -> Future:
+        future: Future = Future()
+        self._embed_queue.put((text, future))
+        return future
+
+    def _drain_embed_queue(self) -> None:
+        """Flusher loop: group queued chunks into batches and dispatch them.
+
+        A batch flushes as soon as it is full or ``_EMBED_FLUSH_INTERVAL``
+        after its first chunk arrived, whichever comes first; the actual API
+        calls run on the embed executor so several batches stay in flight.
+        """
+        while not self._embed_stop.is_set():
             try:
-                embedding = self._embed_text(chunk)
-            except Exception as exc:  # pragma: no cover - best effort embedding
-                LOGGER.warning("Embedding failed for chunk %s of %s: %s", idx, document.file_name, exc)
+                batch = [self._embed_queue.get(timeout=0.25)]
+            except queue.Empty:
                 continue
-            self._vector_store.insert_embedding(
-                deal_id=deal.id,
-                document_id=document.id,
-                content=chunk,
-                embedding=embedding,
-                company_name=deal.company_name,
-                file_name=document.file_name,
-                file_type=document.file_type or "text",
-                chunk_index=idx,
-                chunk_size=len(chunk),
-            )
+            deadline = time.monotonic() + _EMBED_FLUSH_INTERVAL
+            while len(batch) < _EMBED_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._embed_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            try:
+                task = self._embed_executor.submit(self._embed_coalesced, batch)
+            except RuntimeError:  # executor shut down mid-flush
+                _resolve_batch(batch)
+                return
+            # Cancelled on shutdown before running: the waiters still need
+            # their futures resolved.
+            task.add_done_callback(functools.partial(_resolve_batch_if_cancelled, batch=batch))
 
-        document.embeddings_created = bool(chunks)
-        document.processing_status = "completed" if chunks else "processed"
-        document.processed_at = utcnow()
-        document.processing_error = None
+    def _embed_coalesced(self, batch: list[tuple[str, Future]]) -> None:
+        try:
+            results = self._embed_batch_resilient([text for text, _ in batch])
+        except Exception as exc:  # pragma: no cover - resilient path already catches
+            for _, future in batch:
+                future.set_exception(exc)
+            return
+        for (_, future), embedding in zip(batch, results):
+            future.set_result(embedding)
+
+    def _embed_batch_resilient(self, texts: list[str]) -> list[Optional[np.ndarray]]:
+        """Embed a batch, halving it on failure to isolate bad chunks.
 
-    def _embed_text(self, text: str) -> list[float]:
+        A rate-limited batch sleeps out the server's Retry-After hint and is
+        retried once before splitting. A single oversized or rejected chunk
+        should not sink its batchmates; recursing down to size one pinpoints
+        the offender, which comes back as ``None``.
+        """
+        failure: Optional[Exception] = None
+        try:
+            return self._embed_texts_batch(texts)
+        except RateLimitError as exc:
+            time.sleep(_retry_after_seconds(exc))
+            try:
+                return self._embed_texts_batch(texts)
+            except Exception as retry_exc:  # pragma: no cover - best effort embedding
+                failure = retry_exc
+        except Exception as exc:  # pragma: no cover - best effort embedding
+            failure = exc
+
+        if len(texts) == 1:
+            LOGGER.debug("Embedding request rejected: %s", failure)
+            return [None]
+        mid = len(texts) // 2
+        return self._embed_batch_resilient(texts[:mid]) + self._embed_batch_resilient(texts[mid:])
+
+    def _embed_texts_batch(self, texts: list[str]) -> list[np.ndarray]:
         response = self._openai.embeddings.create(
             model=EMBEDDING_MODEL,
-            input=text,
+            input=texts,
         )
-        return response.data[0].embedding
+        # float32 ndarrays go straight through pgvector's dumper on insert,
+        # skipping a 1536-element Python list per chunk.
+        return [
+            np.asarray(item.embedding, dtype=np.float32)
+            for item in sorted(response.data, key=lambda item: item.index)
+        ]
+
+    def _cache_embedding(self, key: bytes, embedding: np.ndarray) -> None:
+        with self._embedding_cache_lock:
+            self._embedding_cache[key] = embedding
+            while len(self._embedding_cache) > _EMBED_CACHE_MAX:
+                self._embedding_cache.popitem(last=False)
+
 
+def _resolve_batch(batch: list[tuple[str, Future]]) -> None:
+    """Resolve a batch's futures as failed-to-embed so waiters unblock."""
+    for _, future in batch:
+        if not future.done():
+            future.set_result(None)
 
-def _pdf_text_fallback(path: Path, max_pages: int = 4) -> str:
+
+def _resolve_batch_if_cancelled(task: Future, *, batch: list[tuple[str, Future]]) -> None:
+    if task.cancelled():
+        _resolve_batch(batch)
+
+
+def _extract_and_chunk(path: Path) -> tuple[str, list[str]]:
+    """Process-pool worker: extract and chunk one document.
+
+    Takes only the path so the call stays picklable; the caller re-chunks if
+    a fallback later replaces the extracted text.
+    """
+    extracted = extract_text(path)
+    return extracted, chunk_text(extracted)
+
+
+@functools.lru_cache(maxsize=64)
+def _strategy_for_bucket(page_bucket: int) -> str:
+    pages = page_bucket * _EXTRACT_BATCH_PAGES
+    if pages <= _SEQUENTIAL_MAX_PAGES:
+        return _STRATEGY_SEQUENTIAL
+    if pages <= _THREADED_MAX_PAGES:
+        return _STRATEGY_THREADED
+    return _STRATEGY_PROCESS
+
+
+def _choose_strategy(path: Path) -> str:
+    """Pick an extraction strategy from file size (a cheap page-count proxy).
+
+    The size estimate is only used to route; :meth:`_extract_pdf_parallel`
+    re-checks the real page count and bails back to sequential extraction
+    when the estimate overshot.
+    """
+
+    if path.suffix.lower() != ".pdf":
+        return _STRATEGY_SEQUENTIAL
+    estimated_pages = max(1, path.stat().st_size // _PDF_PAGE_ESTIMATE_BYTES)
+    bucket = -(-estimated_pages // _EXTRACT_BATCH_PAGES)
+    return _strategy_for_bucket(bucket)
+
+
+def _retry_after_seconds(exc: RateLimitError) -> float:
     try:
-        reader = PdfReader(str(path))
-    except Exception as exc:
-        LOGGER.warning("PDF fallback failed for %s: %s", path.name, exc)
-        return ""
-    texts: list[str] = []
-    for index, page in enumerate(reader.pages[:max_pages]):
+        value = exc.response.headers.get("retry-after")
+        if value:
+            return min(float(value), 30.0)
+    except Exception:  # pragma: no cover - header parsing best effort
+        pass
+    return 1.0
+
+
+def _pdf_text_fallback(path: Path, name: str, max_pages: int = 4) -> str:
+    """Different-engine retry on a PDF's first pages, one reader per thread.
+
+    PyPDF2 readers share a stream position and resolved-object cache, so a
+    reader must never be driven from two threads; like
+    :func:`extract_pdf_page_range`, each worker opens its own handle.
+    """
+
+    def extract_page(index: int) -> str:
         try:
-            content = page.extract_text() or ""
+            reader = PdfReader(str(path))
+            if index >= len(reader.pages):
+                return ""
+            return reader.pages[index].extract_text() or ""
         except Exception as exc:
-            LOGGER.warning("Unable to extract text for %s page %s: %s", path.name, index + 1, exc)
-            content = ""
-        if content:
-            texts.append(content)
+            LOGGER.warning("Unable to extract text for %s page %s: %s", name, index + 1, exc)
+            return ""
+
+    with ThreadPoolExecutor(max_workers=min(max_pages, 4)) as pool:
+        texts = [content for content in pool.map(extract_page, range(max_pages)) if content]
     return "\n\n".join(texts).strip()
 
@@ -254,10 +254,16 @@ class JobRegistry:
             self._mark_success(job, result_rel)
             self._update_run(job.id, status=JobState.SUCCESS, finished_at=datetime.utcnow(), result_path=result_rel)
             artifact_ids = self._record_artifacts(job.id, job.deal_id, paths, result_rel)
+            run_updates: Dict[str, UUID] = {}
             variables_artifact_id = artifact_ids.get("variables")
             if variables_artifact_id:
-                self._update_run(job.id, extracted_variables_artifact_id=variables_artifact_id)
+                run_updates["extracted_variables_artifact_id"] = variables_artifact_id
                 job.params.setdefault("extracted_variables_artifact_id", str(variables_artifact_id))
+            rendered_artifact_id = artifact_ids.get("rendered_doc")
+            if rendered_artifact_id:
+                run_updates["rendered_artifact_id"] = rendered_artifact_id
+            if run_updates:
+                self._update_run(job.id, **run_updates)
             # Embedding now triggered manually via API endpoint for consistency
         except Exception as exc:  # pragma: no cover - execution safeguard
             self._mark_failed(job, str(exc))
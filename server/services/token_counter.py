@@ -3,13 +3,35 @@
 from __future__ import annotations
 
 import base64
-from typing import Iterable, Mapping
+import functools
+from typing import Iterable, Mapping, Optional
+
+import tiktoken
 
 
 class TokenCountingError(RuntimeError):
     """Raised when a block cannot be processed."""
 
 
+@functools.lru_cache(maxsize=1)
+def _get_encoder() -> Optional[tiktoken.Encoding]:
+    # cl100k_base covers the OpenAI embedding/chat models this service uses.
+    # The first call may fetch the vocab file; if that fails (e.g. offline),
+    # fall back to the character heuristic for the life of the process.
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _encode_len(text: str) -> int:
+    encoder = _get_encoder()
+    if encoder is None:
+        return max(1, len(text) // 4)
+    return max(1, len(encoder.encode(text)))
+
+
 def make_text_block(text: str) -> Mapping[str, str]:
     """Create a token counting block for plain text."""
 
@@ -27,9 +49,13 @@ def make_document_block(
     Note: The 'name' field is NOT included because the token counting API
     does not accept it (returns 400 error). The filename parameter is kept
     for API compatibility but is not used in the token counting context.
+
+    The payload is kept as ASCII bytes rather than decoded to str: blocks
+    are only measured locally, and skipping the decode avoids a second
+    full-size copy of large documents.
     """
 
-    encoded = base64.b64encode(data).decode("ascii")
+    encoded = base64.b64encode(data)
     return {
         "type": "document",
         "source": {
@@ -41,9 +67,9 @@ def make_document_block(
 
 
 def make_image_block(*, data: bytes, media_type: str) -> Mapping[str, object]:
-    """Create a token counting block for an image."""
+    """Create a token counting block for an image (payload as ASCII bytes)."""
 
-    encoded = base64.b64encode(data).decode("ascii")
+    encoded = base64.b64encode(data)
     return {
         "type": "image",
         "source": {
@@ -62,14 +88,16 @@ async def count_tokens_for_blocks(blocks: Iterable[Mapping[str, object]]) -> int
         block_type = block.get("type")
         if block_type == "text":
             text = str(block.get("text", ""))
-            total += max(1, len(text) // 4)
+            total += _encode_len(text)
         elif block_type in {"document", "image"}:
             source = block.get("source") or {}
             data = source.get("data", "")
-            try:
-                byte_len = len(base64.b64decode(data))
-            except Exception as exc:  # pragma: no cover - invalid base64
-                raise TokenCountingError(f"Invalid base64 data in block: {exc}") from exc
+            if not isinstance(data, (str, bytes)):
+                raise TokenCountingError("Block data must be a base64 string")
+            # Decoded size follows from the encoded length and padding; no
+            # need to materialise megabytes of decoded bytes just to count.
+            pad = data[-2:].count("=" if isinstance(data, str) else b"=")
+            byte_len = (len(data) * 3) // 4 - pad
             total += max(1, byte_len // 6)
         else:
             total += 1
@@ -7,9 +7,10 @@ from dataclasses import dataclass
 from typing import Iterable, Optional, Sequence
 from uuid import UUID, uuid4
 
-import psycopg
-from pgvector.psycopg import Vector, register_vector
+import numpy as np
+from pgvector.psycopg import register_vector
 from psycopg.rows import dict_row
+from psycopg_pool import ConnectionPool
 
 
 logger = logging.getLogger(__name__)
@@ -32,6 +33,96 @@ class RetrievalResult:
     section_title: Optional[str]
 
 
+_INSERT_EMBEDDING_SQL = """
+    INSERT INTO embeddings (
+        id,
+        deal_id,
+        document_id,
+        content,
+        content_hash,
+        embedding,
+        company_name,
+        file_name,
+        file_type,
+        chunk_index,
+        chunk_size,
+        chunk_overlap,
+        content_type,
+        page_number,
+        section_title,
+        embedding_model,
+        embedding_dimensions
+    )
+    VALUES (
+        %(id)s,
+        %(deal_id)s,
+        %(document_id)s,
+        %(content)s,
+        %(content_hash)s,
+        %(embedding)s,
+        %(company_name)s,
+        %(file_name)s,
+        %(file_type)s,
+        %(chunk_index)s,
+        %(chunk_size)s,
+        %(chunk_overlap)s,
+        %(content_type)s,
+        %(page_number)s,
+        %(section_title)s,
+        %(embedding_model)s,
+        %(embedding_dimensions)s
+    )
+"""
+
+
+_EMBEDDING_COLUMNS = (
+    "id",
+    "deal_id",
+    "document_id",
+    "content",
+    "content_hash",
+    "embedding",
+    "company_name",
+    "file_name",
+    "file_type",
+    "chunk_index",
+    "chunk_size",
+    "chunk_overlap",
+    "content_type",
+    "page_number",
+    "section_title",
+    "embedding_model",
+    "embedding_dimensions",
+)
+
+_EMBEDDING_COLUMN_TYPES = (
+    "uuid",
+    "uuid",
+    "uuid",
+    "text",
+    "text",
+    "vector",
+    "text",
+    "text",
+    "text",
+    "int4",
+    "int4",
+    "int4",
+    "text",
+    "int4",
+    "text",
+    "text",
+    "int4",
+)
+
+_COPY_EMBEDDINGS_SQL = (
+    f"COPY embeddings ({', '.join(_EMBEDDING_COLUMNS)}) FROM STDIN (FORMAT BINARY)"
+)
+
+# Above this row count, COPY's binary framing beats even batched INSERTs.
+_COPY_THRESHOLD = 500
+
+
 class VectorStore:
     """Thin wrapper around pgvector operations targeting the embeddings table."""
 
@@ -40,11 +131,22 @@ class VectorStore:
             raise ValueError("VectorStore requires a valid DATABASE_DSN")
         self.dsn = dsn
         self.embedding_dim = embedding_dim
+        # Pooled connections keep TLS handshakes and register_vector's type
+        # lookups off the per-call path; configure runs once per connection.
+        self._pool = ConnectionPool(
+            dsn,
+            min_size=2,
+            max_size=10,
+            kwargs={"row_factory": dict_row},
+            configure=register_vector,
+        )
+
+    def close(self) -> None:
+        self._pool.close()
 
     def _connect(self):
-        conn = psycopg.connect(self.dsn, row_factory=dict_row)
-        register_vector(conn)
-        return conn
+        """Check a pooled connection out; use as a context manager."""
+        return self._pool.connection()
 
     def ensure_schema(self) -> None:
         """Ensure the pgvector extension exists; the tables are managed externally."""
@@ -86,53 +188,14 @@ class VectorStore:
         with self._connect() as conn, conn.cursor() as cur:
             try:
                 cur.execute(
-                    """
-                    INSERT INTO embeddings (
-                        id,
-                        deal_id,
-                        document_id,
-                        content,
-                        content_hash,
-                        embedding,
-                        company_name,
-                        file_name,
-                        file_type,
-                        chunk_index,
-                        chunk_size,
-                        chunk_overlap,
-                        content_type,
-                        page_number,
-                        section_title,
-                        embedding_model,
-                        embedding_dimensions
-                    )
-                    VALUES (
-                        %(id)s,
-                        %(deal_id)s,
-                        %(document_id)s,
-                        %(content)s,
-                        %(content_hash)s,
-                        %(embedding)s,
-                        %(company_name)s,
-                        %(file_name)s,
-                        %(file_type)s,
-                        %(chunk_index)s,
-                        %(chunk_size)s,
-                        %(chunk_overlap)s,
-                        %(content_type)s,
-                        %(page_number)s,
-                        %(section_title)s,
-                        %(embedding_model)s,
-                        %(embedding_dimensions)s
-                    )
-                    """,
+                    _INSERT_EMBEDDING_SQL,
                     {
                         "id": embedding_id,
                         "deal_id": deal_id,
                         "document_id": document_id,
                         "content": content,
                         "content_hash": content_hash,
-                        "embedding": Vector(list(embedding)),
+                        "embedding": np.asarray(embedding, dtype=np.float32),
                         "company_name": company_name,
                         "file_name": file_name,
                         "file_type": file_type,
@@ -153,6 +216,78 @@ class VectorStore:
 
         return embedding_id
 
+    def insert_embeddings_bulk(self, rows: list[dict]) -> list[UUID]:
+        """Insert many embedding rows over one connection and transaction.
+
+        Small batches go through ``executemany``, which psycopg pipelines and
+        auto-prepares so the statement is parsed once; batches of
+        ``_COPY_THRESHOLD`` rows or more stream through binary COPY, skipping
+        per-row parse/plan entirely. Each row dict takes the same keys as
+        :meth:`insert_embedding`; defaults are filled in here.
+        """
+        if not rows:
+            return []
+
+        prepared: list[dict] = []
+        ids: list[UUID] = []
+        for row in rows:
+            params = dict(row)
+            params.setdefault("id", uuid4())
+            params.setdefault("content_type", "text")
+            params.setdefault("chunk_overlap", 0)
+            params.setdefault("embedding_model", "text-embedding-3-small")
+            params.setdefault("content_hash", None)
+            params.setdefault("page_number", None)
+            params.setdefault("section_title", None)
+            params.setdefault("embedding_dimensions", len(params["embedding"]))
+            # pgvector's psycopg dumper takes ndarrays directly; float32 input
+            # passes through without the per-element Python list round trip.
+            params["embedding"] = np.asarray(params["embedding"], dtype=np.float32)
+            prepared.append(params)
+            ids.append(params["id"])
+
+        with self._connect() as conn:
+            try:
+                with conn.cursor() as cur:
+                    if len(prepared) >= _COPY_THRESHOLD:
+                        with cur.copy(_COPY_EMBEDDINGS_SQL) as copy:
+                            copy.set_types(list(_EMBEDDING_COLUMN_TYPES))
+                            for params in prepared:
+                                copy.write_row(tuple(params[column] for column in _EMBEDDING_COLUMNS))
+                    else:
+                        cur.executemany(_INSERT_EMBEDDING_SQL, prepared)
+                conn.commit()
+            except Exception as exc:
+                conn.rollback()
+                raise VectorStoreError(f"Failed to bulk insert embeddings: {exc}") from exc
+
+        return ids
+
+    def lookup_embedding_by_hash(self, content_hash: str) -> Optional[np.ndarray]:
+        """Return a previously stored vector for this content hash, if any.
+
+        Served by the partial index on ``content_hash``; used to skip
+        re-embedding chunks that already exist under another document.
+        """
+
+        with self._connect() as conn, conn.cursor() as cur:
+            try:
+                cur.execute(
+                    "SELECT embedding FROM embeddings WHERE content_hash = %s LIMIT 1",
+                    (content_hash,),
+                    prepare=True,
+                )
+                row = cur.fetchone()
+            except Exception as exc:
+                raise VectorStoreError(f"Embedding hash lookup failed: {exc}") from exc
+
+        if row is None or row["embedding"] is None:
+            return None
+        stored = row["embedding"]
+        if hasattr(stored, "to_numpy"):  # newer pgvector loads as Vector
+            return stored.to_numpy()
+        return np.asarray(stored, dtype=np.float32)
+
     def delete_embeddings(self, document_id: UUID) -> int:
         """Delete embeddings tied to a document (used on reupload)."""
 
@@ -180,7 +315,7 @@ class VectorStore:
         """Return nearest neighbours using cosine distance, filtered by deal/doc ids."""
 
         where_clauses = []
-        params: list = [Vector(list(embedding))]
+        params: list = [np.asarray(embedding, dtype=np.float32)]
 
         if deal_id:
             where_clauses.append("deal_id = %s")
@@ -192,7 +327,12 @@ class VectorStore:
 
         where_sql = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
 
+        # The CTE binds the query vector once (it is ~6KB on the wire) and
+        # lets both the score expression and the ORDER BY reference it. The
+        # scan runs against the generated fp16 column, which halves the bytes
+        # read per candidate with negligible recall loss for this model.
         sql = f"""
+        WITH q AS (SELECT %s::halfvec(1536) AS v)
         SELECT
             id,
             deal_id,
@@ -202,21 +342,32 @@ class VectorStore:
             file_type,
             chunk_index,
             section_title,
-            1 - (embedding <=> %s) AS score
-        FROM embeddings
+            1 - (embedding_half <=> q.v) AS score
+        FROM embeddings, q
         {where_sql}
-        ORDER BY embedding <=> %s ASC
+        ORDER BY embedding_half <=> q.v ASC
         LIMIT %s
         """
 
-        params.append(Vector(list(embedding)))
         params.append(top_k)
 
         with self._connect() as conn, conn.cursor() as cur:
             try:
-                cur.execute(sql, params)
+                # Widen the HNSW candidate list with k: pgvector's default
+                # ef_search of 40 starves recall once top_k grows past ~10.
+                # set_config(..., true) scopes it to this transaction, so the
+                # pooled connection comes back with its default intact.
+                cur.execute(
+                    "SELECT set_config('hnsw.ef_search', %s, true)",
+                    (str(max(40, top_k * 4)),),
+                )
+                # prepare=True caches the server-side plan on the pooled
+                # connection, skipping re-parse/re-plan on repeat searches.
+                cur.execute(sql, params, prepare=True)
                 rows = cur.fetchall()
+                conn.commit()
             except Exception as exc:
+                conn.rollback()
                 raise VectorStoreError(f"Similarity search failed: {exc}") from exc
 
         return [